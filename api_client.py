@@ -1,13 +1,28 @@
 """API client for Finscreener Developer API communication."""
 
 import os
+import io
 import json
+import base64
+import asyncio
+import hashlib
+import importlib.util
 import logging
-from typing import Any, Dict, Optional
-from datetime import datetime, timezone
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 import httpx
 
+from mcp_server import serde
+from mcp_server.rate_limit import RateLimiter, TokenBucket
+from mcp_server.resilience import CircuitBreaker, RetryPolicy
+
 # Load environment variables
 load_dotenv()
 
@@ -17,6 +32,193 @@ logger = logging.getLogger(__name__)
 API_BASE = os.getenv("FINSCREENER_API_BASE", "https://api.finscreener.in")
 API_KEY = os.getenv("FINSCREENER_API_KEY", "")
 
+# Multiplex concurrent tool calls over one connection (requires httpx[http2])
+HTTP2 = os.getenv("FINSCREENER_HTTP2", "true").lower() not in ("0", "false", "no")
+
+# Connection pool shared by all tool calls. With HTTP/2 most bursts ride a
+# single connection; the cap only matters for HTTP/1.1 fallback.
+CONNECTION_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0
+)
+
+# Fail fast on an unreachable host; read timeouts stay per request since
+# screener queries can legitimately run for minutes
+CONNECT_TIMEOUT = 5.0
+
+# Let the API turn screener queries into watchlists/orders itself ("from_query")
+# instead of round-tripping the results through this process
+SERVER_SIDE_CONVERSION = os.getenv("FINSCREENER_SERVER_SIDE_CONVERSION", "false").lower() in ("1", "true", "yes")
+
+# JWT cache so process restarts can skip the login round-trip (set empty to disable)
+TOKEN_CACHE_PATH = os.getenv("FINSCREENER_TOKEN_CACHE", "~/.cache/finscreener/jwt.json")
+
+# Refresh tokens this long before they actually expire
+TOKEN_EXPIRY_MARGIN = timedelta(seconds=60)
+
+# Developer API endpoints, with the /api prefix already applied
+ENDPOINTS = {
+    "login": "/api/auth/login",
+    "company_search": "/api/company/company-filter",
+    "director_search": "/api/company/director-filter",
+    "gst_search": "/api/gst/gst-filter",
+    "company_details": "/api/company/details",
+    "director_details": "/api/company/director-details",
+    "gst_details": "/api/gst/details",
+    "watchlists": "/api/watchlist",
+    "screener_search": "/api/screener/search",
+    "screeners": "/api/screener/screeners",
+    "orders": "/api/orders",
+    "orders_normal": "/api/orders/normal",
+    "users_me": "/api/users/me",
+    "crm_orders": "/api/crm/orders",
+    "crm_newlead": "/api/crm/newlead",
+    "reference_nic": "/api/reference/nic",
+    "reference_hsn": "/api/reference/hsn",
+    "reference_sac": "/api/reference/sac",
+}
+
+LOGIN_ENDPOINT = ENDPOINTS["login"]
+
+# Only these are safe to resend; POST is retried solely for the login exchange
+RETRYABLE_METHODS = frozenset({"GET", "PUT", "DELETE"})
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Client-side rate limits: detail endpoints are capped per day, the rest are
+# optional (requests per minute, 0 disables)
+DETAIL_DAILY_LIMIT = int(os.getenv("FINSCREENER_DETAIL_DAILY_LIMIT", "100"))
+STANDARD_PER_MINUTE_LIMIT = int(os.getenv("FINSCREENER_RATE_LIMIT_PER_MINUTE", "0"))
+
+# Most requests a single tool call's fan-out keeps in flight at once
+MAX_CONCURRENT = 8
+
+# Longest a tool call will queue for a rate limit token before giving up
+RATE_LIMIT_MAX_WAIT = 30.0
+
+# POST endpoints that only read, so they must not invalidate cached responses
+READ_ONLY_ENDPOINTS = frozenset({
+    ENDPOINTS["screener_search"],
+    ENDPOINTS["crm_newlead"],
+})
+
+# Endpoints in the "detail" rate limit bucket; anything else is "standard"
+DETAIL_ENDPOINTS = frozenset({
+    ENDPOINTS["company_details"],
+    ENDPOINTS["director_details"],
+    ENDPOINTS["gst_details"],
+})
+
+
+def _http2_available() -> bool:
+    """Check whether HTTP/2 is enabled and the optional h2 package is installed."""
+    if not HTTP2:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 unavailable (h2 not installed), using HTTP/1.1. Install httpx[http2] to enable it.")
+        return False
+    return True
+
+
+def _timeout(seconds: float) -> httpx.Timeout:
+    return httpx.Timeout(seconds, connect=CONNECT_TIMEOUT)
+
+
+def _token_expiry(token: str) -> Optional[datetime]:
+    """Read the `exp` claim from a JWT payload (signature is not verified)."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return datetime.fromtimestamp(claims["exp"], tz=timezone.utc)
+    except (IndexError, KeyError, TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Get the server-requested wait from the Retry-After header or `resets_at`."""
+    reset_at = None
+    value = response.headers.get("Retry-After")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                reset_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                pass
+    if reset_at is None:
+        try:
+            detail = serde.loads(response.content).get("detail", {})
+            reset_at = datetime.fromisoformat(str(detail["resets_at"]).replace("Z", "+00:00"))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# GET response cache TTLs (seconds) by endpoint prefix; other endpoints are not cached.
+# Detail data rarely changes and classification codes are static.
+CACHE_TTLS = (
+    (ENDPOINTS["company_details"], 86400.0),
+    (ENDPOINTS["director_details"], 86400.0),
+    (ENDPOINTS["gst_details"], 86400.0),
+    ("/api/reference/", 30 * 86400.0),
+    (ENDPOINTS["company_search"], 60.0),
+    (ENDPOINTS["director_search"], 60.0),
+    (ENDPOINTS["gst_search"], 60.0),
+    (ENDPOINTS["watchlists"], 60.0),
+    (ENDPOINTS["screeners"], 60.0),
+)
+CACHE_MAX_ENTRIES = 1024
+
+# Detail lookup kind -> (endpoint, identifier query parameter)
+DETAIL_LOOKUPS = {
+    "company": (ENDPOINTS["company_details"], "cin"),
+    "director": (ENDPOINTS["director_details"], "din"),
+    "gst": (ENDPOINTS["gst_details"], "gstin"),
+}
+
+
+@lru_cache(maxsize=128)
+def _normalize_endpoint(endpoint: str, use_api_prefix: bool) -> str:
+    """Add the /api prefix to an endpoint unless it is already present."""
+    if use_api_prefix and not endpoint.startswith("/api"):
+        return f"/api{endpoint}"
+    return endpoint
+
+
+def _cache_ttl(method: str, endpoint: str) -> Optional[float]:
+    """Get how long a response may be cached, or None if it must not be."""
+    if method.upper() != "GET":
+        return None
+    for prefix, ttl in CACHE_TTLS:
+        if endpoint.startswith(prefix):
+            return ttl
+    return None
+
+
+def _reports_failure(body: bytes) -> bool:
+    """Check whether a raw JSON body has a top-level "success": false.
+
+    Only bodies that mention the key at all are parsed.
+    """
+    if b'"success"' not in body:
+        return False
+    try:
+        result = serde.loads(body)
+    except ValueError:
+        return False
+    return isinstance(result, dict) and result.get("success") is False
+
+
+def _build_rate_limiter() -> RateLimiter:
+    buckets = {"detail": TokenBucket(DETAIL_DAILY_LIMIT, 86400.0)}
+    if STANDARD_PER_MINUTE_LIMIT > 0:
+        buckets["standard"] = TokenBucket(STANDARD_PER_MINUTE_LIMIT, 60.0)
+    return RateLimiter(buckets)
+
 
 class FinscreenerClient:
     """HTTP client for Finscreener Developer API.
@@ -32,7 +234,16 @@ class FinscreenerClient:
         self.api_base = (api_base or API_BASE).rstrip("/")
         self._jwt_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
+        self._token_lock = asyncio.Lock()
         self._rate_limit_info: Dict[str, Any] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._retry = RetryPolicy(max_attempts=3, base=0.2, cap=2.0)
+        self._breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+        self._limiter = _build_rate_limiter()
+        # (method, endpoint, params) -> (expires_at, response), in LRU order
+        self._cache: OrderedDict = OrderedDict()
+        # (method, endpoint, params) -> task for GET requests currently in flight
+        self._inflight: Dict[tuple, asyncio.Task] = {}
         self._validate_config()
 
     def _validate_config(self):
@@ -42,12 +253,139 @@ class FinscreenerClient:
         elif not self.api_key.startswith("fsk_"):
             logger.warning("API key should start with 'fsk_' prefix.")
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared pooled HTTP client, creating it on first use.
+
+        Created lazily because there may be no running event loop at import time.
+        Keep-alive connections are reused across tool calls.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.api_base,
+                http2=_http2_available(),
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                },
+                limits=CONNECTION_LIMITS,
+                timeout=_timeout(30.0)
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client and release pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request on the shared client, retrying transient failures.
+
+        Idempotent methods and the login exchange are retried with jittered
+        backoff on transport errors and 429/502/503/504 responses. A 429 is
+        retried only after the server's Retry-After (or `resets_at`), and only
+        if that is short enough. Detail endpoints are never retried: each
+        attempt spends daily quota the client-side limiter didn't account for.
+
+        Raises:
+            httpx.TransportError: If the final attempt fails to get a response
+        """
+        client = self._get_client()
+        retryable = (
+            (method.upper() in RETRYABLE_METHODS and url not in DETAIL_ENDPOINTS)
+            or url == LOGIN_ENDPOINT
+        )
+        attempts = self._retry.max_attempts if retryable else 1
+
+        attempt = 0
+        while True:
+            is_last = attempt == attempts - 1
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if is_last:
+                    raise
+                delay = self._retry.backoff(attempt)
+                logger.info(f"Retrying {method} {url} after {type(e).__name__} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            if is_last or response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+
+            delay = self._retry.backoff(attempt)
+            if response.status_code == 429:
+                # Without a usable wait (e.g. a daily cap) a quick retry can't succeed
+                retry_after = _retry_after_seconds(response)
+                if retry_after is None or retry_after > self._retry.max_retry_after:
+                    return response
+                delay = retry_after
+            logger.info(f"Retrying {method} {url} after HTTP {response.status_code} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _token_is_valid(self, now: datetime) -> bool:
+        """Check whether the current JWT token is set and not about to expire."""
+        return bool(
+            self._jwt_token
+            and self._token_expires_at
+            and now < self._token_expires_at
+        )
+
+    def _token_cache_file(self) -> Optional[Path]:
+        """Get the JWT cache file path, or None if caching is disabled."""
+        if not TOKEN_CACHE_PATH:
+            return None
+        return Path(TOKEN_CACHE_PATH).expanduser()
+
+    def _api_key_fingerprint(self) -> str:
+        """Hash of the API key, so cached tokens are never reused across keys."""
+        return hashlib.sha256(f"{self.api_base}|{self.api_key}".encode()).hexdigest()
+
+    def _load_cached_token(self, now: datetime) -> bool:
+        """Load a still-valid JWT token from the cache file."""
+        path = self._token_cache_file()
+        if not path:
+            return False
+        try:
+            cached = json.loads(path.read_text())
+            if cached.get("fingerprint") != self._api_key_fingerprint():
+                return False
+            self._jwt_token = cached["access_token"]
+            self._token_expires_at = datetime.fromisoformat(cached["expires_at"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+        if self._token_is_valid(now):
+            logger.info("Using cached JWT token")
+            return True
+        self._jwt_token = None
+        self._token_expires_at = None
+        return False
+
+    def _save_cached_token(self):
+        """Persist the current JWT token and its expiry to the cache file."""
+        path = self._token_cache_file()
+        if not path or not self._jwt_token or not self._token_expires_at:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch(mode=0o600, exist_ok=True)
+            path.write_text(json.dumps({
+                "fingerprint": self._api_key_fingerprint(),
+                "access_token": self._jwt_token,
+                "expires_at": self._token_expires_at.isoformat(),
+            }))
+        except OSError as e:
+            logger.debug(f"Could not write JWT cache: {e}")
+
     async def _ensure_jwt_token(self):
         """Exchange API key for JWT token if needed."""
+        now = datetime.now(timezone.utc)
+
         # Check if we have a valid token
-        if self._jwt_token and self._token_expires_at:
-            if datetime.now(timezone.utc) < self._token_expires_at:
-                return
+        if self._token_is_valid(now):
+            return
 
         if not self.api_key:
             return
@@ -57,49 +395,92 @@ class FinscreenerClient:
             self._jwt_token = self.api_key
             return
 
-        # Exchange API key for JWT token via Developer API
-        async with httpx.AsyncClient() as client:
+        # Only one concurrent tool call performs the exchange; the rest wait for it
+        async with self._token_lock:
+            # Waiting on the lock may have taken a while; don't judge expiry by a stale clock
+            now = datetime.now(timezone.utc)
+            if self._token_is_valid(now) or self._load_cached_token(now):
+                return
+
+            # Exchange API key for JWT token via Developer API
             try:
-                response = await client.post(
-                    f"{self.api_base}/api/auth/login",
+                response = await self._send(
+                    "POST",
+                    LOGIN_ENDPOINT,
                     json={"api_key": self.api_key},
-                    timeout=30.0
+                    timeout=_timeout(30.0)
                 )
                 if response.status_code == 200:
-                    data = response.json()
+                    data = serde.loads(response.content)
                     # Handle nested response format
                     token_data = data.get("token", data)
                     self._jwt_token = token_data.get("access_token")
                     if self._jwt_token:
-                        # Token expires in 60 minutes, refresh at 50 minutes
-                        self._token_expires_at = datetime.now(timezone.utc).replace(
-                            minute=datetime.now(timezone.utc).minute + 50
-                        )
+                        expires_at = _token_expiry(self._jwt_token)
+                        if expires_at:
+                            self._token_expires_at = expires_at - TOKEN_EXPIRY_MARGIN
+                        else:
+                            # Token expires in 60 minutes, refresh at 50 minutes
+                            self._token_expires_at = datetime.now(timezone.utc) + timedelta(minutes=50)
+                        self._save_cached_token()
                         logger.info("Successfully obtained JWT token from API key")
                 else:
                     error_msg = response.text
                     try:
-                        error_json = response.json()
+                        error_json = serde.loads(response.content)
                         error_msg = error_json.get("detail", error_json.get("message", error_msg))
-                    except:
+                    except (ValueError, KeyError, AttributeError):
                         pass
                     logger.warning(f"Failed to exchange API key for JWT: {error_msg}")
             except Exception as e:
                 logger.warning(f"Error exchanging API key: {e}")
 
     def _get_headers(self) -> Dict[str, str]:
-        """Get request headers with authentication."""
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        """Get per-request authentication headers.
+
+        Content-Type and Accept are set once on the shared client.
+        """
+        headers = {}
         if self._jwt_token:
             headers["Authorization"] = f"Bearer {self._jwt_token}"
         return headers
 
+    def _cache_get(self, key: tuple) -> Optional[Any]:
+        """Get a cached response if present and not expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key: tuple, result: Any, ttl: float):
+        """Cache a response, evicting the least recently used entry when full."""
+        self._cache[key] = (time.monotonic() + ttl, result)
+        self._cache.move_to_end(key)
+        if len(self._cache) > CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+    def _invalidate_cache(self, endpoint: str):
+        """Drop cached responses for the resource a write just touched.
+
+        e.g. a POST to /api/watchlist/123 drops everything under /api/watchlist.
+        """
+        root = "/".join(endpoint.split("/")[:3])
+        for key in [k for k in self._cache if k[1].startswith(root)]:
+            del self._cache[key]
+
     def get_rate_limit_info(self) -> Dict[str, Any]:
-        """Get the last known rate limit info from detail endpoints."""
-        return self._rate_limit_info
+        """Get rate limit state.
+
+        Returns:
+            "server": last rate limit info reported by detail endpoints,
+            "client": remaining budget of each client-side bucket
+        """
+        return {"server": self._rate_limit_info, "client": self._limiter.info()}
 
     async def request(
         self,
@@ -108,94 +489,244 @@ class FinscreenerClient:
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         timeout: float = 30.0,
-        use_api_prefix: bool = True
-    ) -> Dict[str, Any]:
+        use_api_prefix: bool = True,
+        raw: bool = False,
+        cache: bool = True
+    ) -> Union[Dict[str, Any], bytes]:
         """Make an async HTTP request to Finscreener Developer API.
 
         Args:
-            method: HTTP method (GET, POST, PUT, DELETE)
-            endpoint: API endpoint (e.g., /company/details)
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE)
+            endpoint: API endpoint, preferably from ENDPOINTS (e.g., ENDPOINTS["company_details"])
             params: Query parameters
-            json_data: JSON body for POST/PUT requests
+            json_data: JSON body for POST/PUT/PATCH requests
             timeout: Request timeout in seconds
             use_api_prefix: Whether to add /api prefix (default True)
+            raw: Return a successful response body as undecoded bytes
+            cache: Whether a GET may be served from and stored in the response cache
 
         Returns:
-            Response data as dictionary
+            Response data as dictionary (or bytes with `raw`)
         """
         # Build URL with /api prefix for developer API
-        if use_api_prefix and not endpoint.startswith("/api"):
-            endpoint = f"/api{endpoint}"
-
-        url = f"{self.api_base}{endpoint}"
+        endpoint = _normalize_endpoint(endpoint, use_api_prefix)
+        method = method.upper()
+
+        if method != "GET":
+            return await self._dispatch(method, endpoint, params, json_data, timeout, raw=raw)
+
+        key = (method, endpoint, json.dumps(params, sort_keys=True, default=str), raw)
+
+        # Serve repeated reads from memory without spending quota
+        ttl = _cache_ttl(method, endpoint) if cache else None
+        if ttl is not None:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        # Identical reads already in flight share a single HTTP call
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._dispatch(method, endpoint, params, json_data, timeout, key, ttl, raw)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller being cancelled doesn't cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _dispatch(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+        timeout: float,
+        cache_key: Optional[tuple] = None,
+        ttl: Optional[float] = None,
+        raw: bool = False
+    ) -> Union[Dict[str, Any], bytes]:
+        """Send a request over the network and turn the response into a result dict.
+
+        Successful responses are cached under `cache_key` when a `ttl` is given;
+        successful writes invalidate related cache entries. With `raw`, a
+        successful response body is returned as undecoded bytes instead.
+        """
+        # Fail fast instead of hammering an API that is already down
+        if not self._breaker.allow_request():
+            return {"success": False, "error": "Circuit open: Finscreener API is unavailable. Try again shortly."}
+
+        # Queue for quota instead of spending a request the server will reject
+        bucket = "detail" if endpoint in DETAIL_ENDPOINTS else "standard"
+        if not await self._limiter.acquire(bucket, max_wait=RATE_LIMIT_MAX_WAIT):
+            state = self._limiter.info()[bucket]
+            return {
+                "success": False,
+                "error": f"Rate limit exceeded: client-side {bucket} request budget exhausted",
+                "rate_limit": {
+                    "limit": state["limit"],
+                    "used": state["limit"] - state["remaining"],
+                    "resets_at": self._rate_limit_info.get("resets_at", "End of day")
+                }
+            }
 
         # Ensure we have a JWT token
         await self._ensure_jwt_token()
 
         headers = self._get_headers()
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    params=params,
-                    json=json_data,
-                    timeout=timeout
-                )
-
-                # Handle rate limit response
-                if response.status_code == 429:
-                    try:
-                        error_json = response.json()
-                        detail = error_json.get("detail", {})
-                        return {
-                            "success": False,
-                            "error": f"Rate limit exceeded: {detail.get('message', 'Daily limit reached')}",
-                            "rate_limit": {
-                                "limit": detail.get("limit", 100),
-                                "used": detail.get("used", 100),
-                                "resets_at": detail.get("resets_at", "End of day")
-                            }
-                        }
-                    except:
-                        return {"success": False, "error": "Rate limit exceeded. Try again tomorrow."}
-
-                # Handle other error responses
-                if response.status_code >= 400:
-                    error_detail = response.text
-                    try:
-                        error_json = response.json()
-                        error_detail = error_json.get("detail", error_json.get("message", error_detail))
-                    except:
-                        pass
+        try:
+            response = await self._send(
+                method,
+                endpoint,
+                headers=headers,
+                params=params,
+                json=json_data,
+                timeout=_timeout(timeout)
+            )
+
+            if response.status_code >= 500:
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+
+            # Handle rate limit response
+            if response.status_code == 429:
+                try:
+                    error_json = serde.loads(response.content)
+                    detail = error_json.get("detail", {})
+                    limit = detail.get("limit", 100)
+                    # The server counts usage per day; only the daily detail bucket shares that window
+                    if bucket == "detail":
+                        self._limiter.sync(bucket, limit, detail.get("used", limit))
                     return {
                         "success": False,
-                        "error": f"API Error ({response.status_code}): {error_detail}"
+                        "error": f"Rate limit exceeded: {detail.get('message', 'Daily limit reached')}",
+                        "rate_limit": {
+                            "limit": detail.get("limit", 100),
+                            "used": detail.get("used", 100),
+                            "resets_at": detail.get("resets_at", "End of day")
+                        }
                     }
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    return {"success": False, "error": "Rate limit exceeded. Try again tomorrow."}
+
+            # Handle other error responses
+            if response.status_code >= 400:
+                error_detail = response.text
+                try:
+                    error_json = serde.loads(response.content)
+                    error_detail = error_json.get("detail", error_json.get("message", error_detail))
+                except (ValueError, KeyError, AttributeError):
+                    pass
+                return {
+                    "success": False,
+                    "error": f"API Error ({response.status_code}): {error_detail}",
+                    "status_code": response.status_code
+                }
+
+            # A successful write changes the resource whatever its body looks like
+            if method != "GET" and endpoint not in READ_ONLY_ENDPOINTS:
+                self._invalidate_cache(endpoint)
+
+            # e.g. 204 No Content from a DELETE
+            if not response.content.strip():
+                return {"success": True}
+
+            if raw:
+                # Same rule as parsed results below: never cache a reported failure
+                if ttl is not None and not _reports_failure(response.content):
+                    self._cache_put(cache_key, response.content, ttl)
+                return response.content
+
+            result = serde.loads(response.content)
+
+            # Store rate limit info if present
+            if isinstance(result, dict) and "rate_limit" in result:
+                self._rate_limit_info = result["rate_limit"]
+                limit = self._rate_limit_info.get("limit")
+                used = self._rate_limit_info.get("used")
+                if bucket == "detail" and isinstance(limit, int) and isinstance(used, int):
+                    self._limiter.sync(bucket, limit, used)
+
+            if ttl is not None and not (isinstance(result, dict) and result.get("success") is False):
+                self._cache_put(cache_key, result, ttl)
+
+            return result
+
+        except httpx.HTTPError as e:
+            self._breaker.record_failure()
+            if isinstance(e, httpx.TimeoutException):
+                return {"success": False, "error": "Request timed out. Try with a simpler query."}
+            return {"success": False, "error": f"Request failed: {str(e)}"}
+        except Exception as e:
+            logger.exception("Unexpected error during API request")
+            return {"success": False, "error": f"Unexpected error: {str(e)}"}
 
-                result = response.json()
+    async def _get_detail(
+        self,
+        sem: asyncio.Semaphore,
+        endpoint: str,
+        param: str,
+        identifier: str
+    ) -> Dict[str, Any]:
+        async with sem:
+            return await self.get(endpoint, params={param: identifier})
 
-                # Store rate limit info if present
-                if isinstance(result, dict) and "rate_limit" in result:
-                    self._rate_limit_info = result["rate_limit"]
+    async def batch_get_details(
+        self,
+        kind: str,
+        ids: List[str],
+        max_concurrent: int = MAX_CONCURRENT
+    ) -> List[Dict[str, Any]]:
+        """Fetch details for many entities concurrently.
 
-                return result
+        Args:
+            kind: "company", "director", or "gst"
+            ids: CINs, DINs, or GSTINs to look up
+            max_concurrent: Maximum requests in flight at once
 
-            except httpx.TimeoutException:
-                return {"success": False, "error": "Request timed out. Try with a simpler query."}
-            except httpx.RequestError as e:
-                return {"success": False, "error": f"Request failed: {str(e)}"}
-            except Exception as e:
-                logger.exception("Unexpected error during API request")
-                return {"success": False, "error": f"Unexpected error: {str(e)}"}
+        Returns:
+            One response per id, in the same order; failures become error dicts
+        """
+        if kind not in DETAIL_LOOKUPS:
+            raise ValueError(f"Invalid detail kind '{kind}'. Must be one of: {list(DETAIL_LOOKUPS)}")
+
+        endpoint, param = DETAIL_LOOKUPS[kind]
+        sem = asyncio.Semaphore(max_concurrent)
+        results = await asyncio.gather(
+            *(self._get_detail(sem, endpoint, param, i) for i in ids),
+            return_exceptions=True
+        )
+        return [
+            {"success": False, "error": f"Unexpected error: {r}"} if isinstance(r, BaseException) else r
+            for r in results
+        ]
 
     # Convenience methods
     async def get(self, endpoint: str, params: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
         """Make GET request."""
         return await self.request("GET", endpoint, params=params, **kwargs)
 
+    async def get_raw(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        timeout: float = 30.0,
+        use_api_prefix: bool = True
+    ) -> Union[Dict[str, Any], bytes]:
+        """Make GET request and return the response body without decoding it.
+
+        For endpoints whose JSON is handed back verbatim, this skips a full
+        decode/encode round-trip. Cached and coalesced like get().
+
+        Returns:
+            Body bytes on success, otherwise the usual error dict
+        """
+        return await self.request(
+            "GET", endpoint, params=params, timeout=timeout, use_api_prefix=use_api_prefix, raw=True
+        )
+
     async def post(self, endpoint: str, json_data: Optional[Dict] = None, params: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
         """Make POST request."""
         return await self.request("POST", endpoint, params=params, json_data=json_data, **kwargs)
@@ -204,6 +735,10 @@ class FinscreenerClient:
         """Make PUT request."""
         return await self.request("PUT", endpoint, json_data=json_data, **kwargs)
 
+    async def patch(self, endpoint: str, json_data: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
+        """Make PATCH request."""
+        return await self.request("PATCH", endpoint, json_data=json_data, **kwargs)
+
     async def delete(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make DELETE request."""
         return await self.request("DELETE", endpoint, **kwargs)
@@ -235,32 +770,37 @@ def format_response(data: Any, title: str = "") -> str:
         if "data" in data:
             data = data["data"]
 
-    output = []
+    if isinstance(data, list) and not data:
+        return "No results found."
+
+    buf = io.StringIO()
+    write = buf.write
+    dumps = serde.dumps_pretty
+
     if title:
-        output.append(f"## {title}\n")
+        write(f"## {title}\n\n")
 
     if isinstance(data, list):
-        if not data:
-            return "No results found."
-
         for i, item in enumerate(data, 1):
             if isinstance(item, dict):
-                # Filter out None values and format nicely
-                item_parts = []
-                for k, v in item.items():
-                    if v is not None and k not in ["_id", "id"]:
-                        item_parts.append(f"**{k}**: {v}")
-                output.append(f"{i}. " + " | ".join(item_parts[:4]))  # Limit to 4 fields per line
+                # Skip None values and ids, limit to 4 fields per line
+                parts = islice(
+                    (f"**{k}**: {v}" for k, v in item.items() if v is not None and k not in {"_id", "id"}),
+                    4
+                )
+                write(f"{i}. {' | '.join(parts)}\n")
             else:
-                output.append(f"{i}. {item}")
+                write(f"{i}. {item}\n")
     elif isinstance(data, dict):
         for key, value in data.items():
             if value is not None:
                 if isinstance(value, (dict, list)):
-                    output.append(f"**{key}**: {json.dumps(value, indent=2, default=str)}")
+                    write(f"**{key}**: {dumps(value)}\n")
                 else:
-                    output.append(f"**{key}**: {value}")
+                    write(f"**{key}**: {value}\n")
     else:
-        output.append(str(data))
+        write(f"{data}\n")
 
-    return "\n".join(output) if output else "No data available."
+    # Every line ends in a newline; drop the last one
+    output = buf.getvalue()
+    return output[:-1] if output else "No data available."
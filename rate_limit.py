@@ -0,0 +1,101 @@
+"""Client-side rate limiting for Finscreener API calls."""
+
+import asyncio
+import time
+from typing import Any, Dict
+
+
+class TokenBucket:
+    """Async token bucket allowing `capacity` requests per `period` seconds.
+
+    Tokens refill continuously. Callers that find the bucket empty queue up
+    (FIFO) behind a lock instead of firing a request the server will reject.
+    """
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.period = period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.capacity / self.period)
+        self._updated = now
+
+    @property
+    def remaining(self) -> int:
+        """Whole tokens currently available."""
+        self._refill()
+        return int(self._tokens)
+
+    async def acquire(self, max_wait: float) -> bool:
+        """Take one token, waiting up to `max_wait` seconds for it.
+
+        Time spent queued behind other callers counts against `max_wait`.
+
+        Returns:
+            False if no token would be available within `max_wait`
+        """
+        deadline = time.monotonic() + max_wait
+        try:
+            await asyncio.wait_for(self._lock.acquire(), timeout=max_wait)
+        except asyncio.TimeoutError:
+            return False
+        try:
+            # A zero-capacity bucket never refills
+            if self.capacity <= 0:
+                return False
+            self._refill()
+            if self._tokens < 1:
+                wait = (1 - self._tokens) * self.period / self.capacity
+                if wait > deadline - time.monotonic():
+                    return False
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= 1
+            return True
+        finally:
+            self._lock.release()
+
+    def sync(self, limit: int, used: int):
+        """Adopt the server's authoritative limit and usage.
+
+        A non-positive limit is clamped to 1 so the bucket still refills.
+        """
+        self.capacity = max(1, limit)
+        self._tokens = float(max(0, limit - used))
+        self._updated = time.monotonic()
+
+
+class RateLimiter:
+    """Named token buckets; requests to an unknown bucket are not limited."""
+
+    def __init__(self, buckets: Dict[str, TokenBucket]):
+        self._buckets = buckets
+
+    async def acquire(self, bucket: str, max_wait: float) -> bool:
+        """Take a token from the named bucket. See TokenBucket.acquire."""
+        limiter = self._buckets.get(bucket)
+        if limiter is None:
+            return True
+        return await limiter.acquire(max_wait)
+
+    def sync(self, bucket: str, limit: int, used: int):
+        """Sync the named bucket with server-reported usage."""
+        limiter = self._buckets.get(bucket)
+        if limiter is not None:
+            limiter.sync(limit, used)
+
+    def info(self) -> Dict[str, Any]:
+        """Get the client-side state of every bucket."""
+        return {
+            name: {
+                "limit": b.capacity,
+                "remaining": b.remaining,
+                "period_seconds": b.period,
+            }
+            for name, b in self._buckets.items()
+        }
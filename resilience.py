@@ -0,0 +1,68 @@
+"""Retry and circuit breaker helpers for Finscreener API calls."""
+
+import random
+import time
+from typing import Optional
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient API failures.
+
+    Delay for attempt n is uniform in [0, min(cap, base * 2**n)].
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base: float = 0.2,
+        cap: float = 2.0,
+        max_retry_after: float = 10.0
+    ):
+        self.max_attempts = max_attempts
+        self.base = base
+        self.cap = cap
+        # Server-requested waits longer than this are not worth blocking a tool call for
+        self.max_retry_after = max_retry_after
+
+    def backoff(self, attempt: int) -> float:
+        """Get the jittered delay before retrying after the given attempt (0-based)."""
+        return min(self.cap, self.base * (2 ** attempt)) * random.random()
+
+
+class CircuitBreaker:
+    """Fail fast while the API is down.
+
+    Opens after `failure_threshold` consecutive failures. Once `reset_timeout`
+    seconds have passed, requests are let through again (half-open); a success
+    closes the circuit and another failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open", or "half_open"."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent."""
+        return self.state != "open"
+
+    def record_success(self):
+        """Reset the failure count and close the circuit."""
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self):
+        """Count a failure, opening the circuit once the threshold is reached."""
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
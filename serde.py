@@ -0,0 +1,78 @@
+"""JSON serialization helpers.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Results wrapping a list longer than this are serialized without indentation
+COMPACT_THRESHOLD = 20
+
+# Keys under which API responses carry their list payload
+LIST_KEYS = ("results", "items", "data")
+
+# Stdlib fallbacks, built once: json.dumps() constructs a new encoder on every
+# call that passes options
+_encode_pretty = json.JSONEncoder(indent=2, default=str).encode
+_encode_compact = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize to 2-space indented JSON, stringifying unsupported types."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return _encode_pretty(obj)
+
+
+def dumps_compact(obj: Any) -> str:
+    """Serialize to JSON without whitespace, stringifying unsupported types."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return _encode_compact(obj)
+
+
+def _is_large(obj: Any) -> bool:
+    """Check whether obj is, or wraps, a list longer than COMPACT_THRESHOLD."""
+    if isinstance(obj, list):
+        return len(obj) > COMPACT_THRESHOLD
+    if isinstance(obj, dict):
+        return any(
+            isinstance(obj.get(k), list) and len(obj[k]) > COMPACT_THRESHOLD
+            for k in LIST_KEYS
+        )
+    return False
+
+
+def dumps(obj: Any) -> str:
+    """Serialize a tool result for the MCP client.
+
+    Large list results are encoded compactly, since indentation there mostly
+    costs model context; small results keep pretty-printing for readability.
+    """
+    if _is_large(obj):
+        return dumps_compact(obj)
+    return dumps_pretty(obj)
+
+
+def as_text(result: Union[bytes, Any]) -> str:
+    """Return a raw JSON body as-is, serializing anything else with dumps_compact."""
+    if isinstance(result, bytes):
+        return result.decode()
+    return dumps_compact(result)
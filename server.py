@@ -13,22 +13,34 @@ Usage:
 
 import os
 import logging
-from typing import Optional, List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
-from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
-# Load environment variables
-load_dotenv()
-
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Configuration, including load_dotenv(), lives in api_client; importing it
+# loads .env before any setting is read
+from mcp_server.api_client import client
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared HTTP client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
 # Initialize FastMCP server
 mcp = FastMCP(
     "finscreener",
-    dependencies=["httpx", "python-dotenv"]
+    dependencies=["httpx[http2]", "python-dotenv"],
+    lifespan=lifespan
 )
 
 # Import tool implementations
@@ -36,16 +48,20 @@ from mcp_server.tools.search_tools import (
     search_company as _search_company,
     search_director as _search_director,
     search_gst as _search_gst,
+    search_companies_bulk as _search_companies_bulk,
 )
 from mcp_server.tools.detail_tools import (
     get_company_details as _get_company_details,
     get_director_details as _get_director_details,
     get_gst_details as _get_gst_details,
+    batch_get_company_details as _batch_get_company_details,
 )
 from mcp_server.tools.watchlist_tools import (
     list_watchlists as _list_watchlists,
     get_watchlist_details as _get_watchlist_details,
+    get_watchlist_all as _get_watchlist_all,
     create_watchlist as _create_watchlist,
+    create_watchlists_bulk as _create_watchlists_bulk,
     delete_watchlist as _delete_watchlist,
 )
 from mcp_server.tools.screener_tools import (
@@ -78,12 +94,18 @@ from mcp_server.tools.crm_tools import (
 
 
 # ============================================================================
-# Search Tools
+# Tool Registry
 # ============================================================================
+# Tools are registered straight from their implementations, so FastMCP reads
+# each tool's parameters from the implementation's signature and no forwarding
+# wrapper sits between the MCP call and the API call.
 
-@mcp.tool()
-async def search_company(query: str) -> str:
-    """Search for companies by name to get CIN (Corporate Identification Number).
+TOOLS = [
+    # Search Tools
+    (
+        "search_company",
+        _search_company,
+        """Search for companies by name to get CIN (Corporate Identification Number).
 
     NOTE: Name search can be slow on large datasets.
     For faster industry-based search, use run_screener instead:
@@ -92,143 +114,173 @@ async def search_company(query: str) -> str:
 
     Args:
         query: Company name fragment or CIN (21-char CIN is faster)
-    """
-    return await _search_company(query)
+        state: Optional state filter
+        city: Optional city filter
+        limit: Maximum results (default 10, max 100)
+    """,
+    ),
+    (
+        "search_companies_bulk",
+        _search_companies_bulk,
+        """Search for several companies at once by name or CIN.
+
+    Searches run concurrently, so this is much faster than calling
+    search_company repeatedly.
 
+    Args:
+        queries: Company name fragments or CINs
+        state: Optional state filter applied to every search
+        city: Optional city filter applied to every search
+        limit: Maximum results per query (default 10, max 100)
+    """,
+    ),
+    (
+        "search_director",
+        _search_director,
+        """Search for directors by name to get DIN (Director Identification Number).
 
-@mcp.tool()
-async def search_director(query: str) -> str:
-    """Search for directors by name to get DIN (Director Identification Number).
-    
     Use this when you need to find a director's DIN from their name.
-    
+
     Args:
         query: Director name fragment or DIN snippet to search for
-    """
-    return await _search_director(query)
-
+        state: Optional state filter
+        limit: Maximum results (default 10, max 100)
+    """,
+    ),
+    (
+        "search_gst",
+        _search_gst,
+        """Search for GST registrations by business name to get GSTIN.
 
-@mcp.tool()
-async def search_gst(query: str) -> str:
-    """Search for GST registrations by business name to get GSTIN.
-    
     Use this when you need to find a business's GSTIN from its trade name.
-    
+
     Args:
         query: Trade name fragment or GSTIN snippet to search for
-    """
-    return await _search_gst(query)
-
+        state: Optional state filter
+        status: Optional registration status filter (e.g., "Active")
+        limit: Maximum results (default 10, max 100)
+    """,
+    ),
+
+    # Detail Tools
+    (
+        "get_company_details",
+        _get_company_details,
+        """Get detailed information about a company using its CIN.
 
-# ============================================================================
-# Detail Tools
-# ============================================================================
-
-@mcp.tool()
-async def get_company_details(cin: str) -> str:
-    """Get detailed information about a company using its CIN.
-    
     Returns incorporation date, capital, status, registered address, directors, etc.
-    
+
     Args:
         cin: Corporate Identification Number (CIN) of the company
-    """
-    return await _get_company_details(cin)
-
+    """,
+    ),
+    (
+        "get_director_details",
+        _get_director_details,
+        """Get detailed information about a director using their DIN.
 
-@mcp.tool()
-async def get_director_details(din: str) -> str:
-    """Get detailed information about a director using their DIN.
-    
     Returns director profile, disqualification status, and associated companies.
-    
+
     Args:
         din: Director Identification Number (DIN) of the director
-    """
-    return await _get_director_details(din)
+    """,
+    ),
+    (
+        "get_gst_details",
+        _get_gst_details,
+        """Get detailed GST registration information using GSTIN.
 
-
-@mcp.tool()
-async def get_gst_details(gstin: str) -> str:
-    """Get detailed GST registration information using GSTIN.
-    
     Returns status, taxpayer type, registration date, address, etc.
-    
+
     Args:
         gstin: 15-character GST Identification Number (GSTIN)
-    """
-    return await _get_gst_details(gstin)
+    """,
+    ),
+    (
+        "batch_get_company_details",
+        _batch_get_company_details,
+        """Get detailed information about several companies at once using their CINs.
 
+    Lookups run concurrently, so this is much faster than calling
+    get_company_details repeatedly. Each CIN counts against the daily detail limit.
 
-# ============================================================================
-# Watchlist Tools
-# ============================================================================
+    Args:
+        cins: List of Corporate Identification Numbers (CINs)
+    """,
+    ),
+
+    # Watchlist Tools
+    (
+        "list_watchlists",
+        _list_watchlists,
+        """List all watchlists owned by the current user.
 
-@mcp.tool()
-async def list_watchlists() -> str:
-    """List all watchlists owned by the current user.
-    
     Returns list of watchlists with id, name, type, and item count.
-    """
-    return await _list_watchlists()
-
-
-@mcp.tool()
-async def get_watchlist_details(
-    watchlist_id: str,
-    page: int = 1,
-    limit: int = 10,
-    search_query: Optional[str] = None
-) -> str:
-    """Get the contents of a specific watchlist.
-    
+    """,
+    ),
+    (
+        "get_watchlist_details",
+        _get_watchlist_details,
+        """Get the contents of a specific watchlist.
+
     Args:
         watchlist_id: ID of the watchlist to inspect
         page: Page number for pagination (default 1)
         limit: Items per page (default 10)
         search_query: Optional text filter for entity name/identifier
-    """
-    return await _get_watchlist_details(watchlist_id, page, limit, search_query)
+    """,
+    ),
+    (
+        "get_watchlist_all",
+        _get_watchlist_all,
+        """Get every entity in a watchlist in one call.
 
+    Pages are fetched concurrently, so this is faster than paging through
+    get_watchlist_details for large watchlists.
+
+    Args:
+        watchlist_id: ID of the watchlist to inspect
+        search_query: Optional text filter for entity name/identifier
+    """,
+    ),
+    (
+        "create_watchlist",
+        _create_watchlist,
+        """Create a new watchlist to track companies, directors, or GST registrations.
 
-@mcp.tool()
-async def create_watchlist(
-    name: str,
-    watchlist_type: str,
-    items: Optional[List[dict]] = None
-) -> str:
-    """Create a new watchlist to track companies, directors, or GST registrations.
-    
     Args:
         name: Display name for the watchlist
         watchlist_type: Type of entities - "company", "director", or "gst"
         items: Optional list of entities to add, each with "number" (CIN/DIN/GSTIN) and "name"
-    """
-    return await _create_watchlist(name, watchlist_type, items)
+    """,
+    ),
+    (
+        "create_watchlists_bulk",
+        _create_watchlists_bulk,
+        """Create several watchlists at once.
 
+    Watchlists are created concurrently. Returns one result per spec, in order.
 
-@mcp.tool()
-async def delete_watchlist(watchlist_id: str) -> str:
-    """Delete a watchlist.
-    
     Args:
-        watchlist_id: ID of the watchlist to delete
-    """
-    return await _delete_watchlist(watchlist_id)
-
+        specs: List of watchlists, each with "name", "watchlist_type" ("company", "director", or "gst"),
+            and optional "items" (each with "number" and "name")
+    """,
+    ),
+    (
+        "delete_watchlist",
+        _delete_watchlist,
+        """Delete a watchlist.
 
-# ============================================================================
-# Screener Tools
-# ============================================================================
+    Args:
+        watchlist_id: ID of the watchlist to delete
+    """,
+    ),
 
-@mcp.tool()
-async def run_screener(
-    query: str,
-    type: str,
-    page: int = 1,
-    limit: int = 10
-) -> str:
-    """Execute an FQL query to filter companies or GST registrations.
+    # Screener Tools
+    (
+        "run_screener",
+        _run_screener,
+        """Execute an FQL query to filter companies or GST registrations.
 
     IMPORTANT: Field names are case-sensitive!
 
@@ -250,105 +302,76 @@ async def run_screener(
         type: "company" or "gst"
         page: Page number (default 1)
         limit: Results per page (default 10, max 100)
-    """
-    return await _run_screener(query, type, page, limit)
-
-
-@mcp.tool()
-async def create_screener(
-    name: str,
-    query: str,
-    type: str,
-    description: Optional[str] = None
-) -> str:
-    """Save an FQL query as a reusable screener.
-    
+    """,
+    ),
+    (
+        "create_screener",
+        _create_screener,
+        """Save an FQL query as a reusable screener.
+
     Args:
         name: Display name for the screener
         query: FQL query string to save
         type: Type of entities - "company" or "gst"
         description: Optional description of what this screener finds
-    """
-    return await _create_screener(name, query, type, description)
-
-
-@mcp.tool()
-async def list_screeners() -> str:
-    """List all saved screeners owned by the current user."""
-    return await _list_screeners()
+    """,
+    ),
+    (
+        "list_screeners",
+        _list_screeners,
+        """List all saved screeners owned by the current user.
+    """,
+    ),
+    (
+        "get_screener",
+        _get_screener,
+        """Get a saved screener by ID.
 
-
-@mcp.tool()
-async def get_screener(screener_id: str) -> str:
-    """Get a saved screener by ID.
-    
     Args:
         screener_id: ID of the screener to fetch
-    """
-    return await _get_screener(screener_id)
-
-
-@mcp.tool()
-async def update_screener(
-    screener_id: str,
-    name: Optional[str] = None,
-    query: Optional[str] = None,
-    type: Optional[str] = None,
-    description: Optional[str] = None
-) -> str:
-    """Update an existing screener's properties.
-    
+    """,
+    ),
+    (
+        "update_screener",
+        _update_screener,
+        """Update an existing screener's properties.
+
     Args:
         screener_id: ID of the screener to update
         name: New name (optional)
         query: New FQL query (optional)
         type: New entity type (optional)
         description: New description (optional)
-    """
-    return await _update_screener(screener_id, name, query, type, description)
+    """,
+    ),
+    (
+        "delete_screener",
+        _delete_screener,
+        """Delete a saved screener.
 
-
-@mcp.tool()
-async def delete_screener(screener_id: str) -> str:
-    """Delete a saved screener.
-    
     Args:
         screener_id: ID of the screener to delete
-    """
-    return await _delete_screener(screener_id)
-
-
-@mcp.tool()
-async def screener_to_watchlist(
-    watchlist_name: str,
-    watchlist_type: str,
-    query: str,
-    limit: int = 100
-) -> str:
-    """Convert screener results into a watchlist for monitoring.
+    """,
+    ),
+    (
+        "screener_to_watchlist",
+        _screener_to_watchlist,
+        """Convert screener results into a watchlist for monitoring.
 
     Args:
         watchlist_name: Name for the new watchlist
         watchlist_type: Type - "company", "director", or "gst"
         query: FQL query to execute
         limit: Maximum entities to add (default 100)
-    """
-    return await _screener_to_watchlist(watchlist_name, watchlist_type, query, limit)
-
-
-@mcp.tool()
-async def screener_to_order(
-    order_name: str,
-    payment_option: str,
-    query: Optional[str] = None,
-    screener_id: Optional[str] = None,
-    type: Optional[str] = None,
-    limit: Optional[int] = None
-) -> str:
-    """Create an order from screener results to purchase detailed data.
-    
+    """,
+    ),
+    (
+        "screener_to_order",
+        _screener_to_order,
+        """Create an order from screener results to purchase detailed data.
+
     Provide either query or screener_id. Use limit to specify how many top results.
-    
+
     Args:
         order_name: Name for the order
         payment_option: "credits" (use credits) or "paylater" (pay later)
@@ -356,49 +379,35 @@ async def screener_to_order(
         screener_id: ID of saved screener (if not using query)
         type: Entity type when using query - "company", "director", or "gst"
         limit: Maximum items to include (e.g., top 50)
-    """
-    return await _screener_to_order(order_name, payment_option, query, screener_id, type, limit)
-
+    """,
+    ),
 
-# ============================================================================
-# Order Tools
-# ============================================================================
-
-@mcp.tool()
-async def list_orders(
-    page: int = 1,
-    limit: int = 10,
-    status: Optional[str] = None,
-    search: Optional[str] = None
-) -> str:
-    """List user's orders with optional filters.
+    # Order Tools
+    (
+        "list_orders",
+        _list_orders,
+        """List user's orders with optional filters.
 
     Args:
         page: Page number (default 1)
         limit: Orders per page (default 10)
         status: Filter by order status
         search: Search in order ID or name
-    """
-    return await _list_orders(page, limit, status, search)
-
-
-@mcp.tool()
-async def get_order_details(order_id: str) -> str:
-    """Get full details for a specific order.
+    """,
+    ),
+    (
+        "get_order_details",
+        _get_order_details,
+        """Get full details for a specific order.
 
     Args:
         order_id: ID of the order to fetch
-    """
-    return await _get_order_details(order_id)
-
-
-@mcp.tool()
-async def create_order(
-    order_name: str,
-    payment_option: str,
-    items: List[dict]
-) -> str:
-    """Create a new order for contacts/registrations.
+    """,
+    ),
+    (
+        "create_order",
+        _create_order,
+        """Create a new order for contacts/registrations.
 
     Order Types & Credit Pricing:
     - company: Company contact data (1 credit)
@@ -410,55 +419,43 @@ async def create_order(
         order_name: Name describing the order
         payment_option: "credits" or "paylater"
         items: List of items with "type", "name", and "number" (CIN/DIN/GSTIN)
-    """
-    return await _create_order(order_name, payment_option, items)
-
-
-@mcp.tool()
-async def watchlist_to_order(
-    watchlist_id: str,
-    order_name: str,
-    payment_option: str
-) -> str:
-    """Create an order from watchlist items.
+    """,
+    ),
+    (
+        "watchlist_to_order",
+        _watchlist_to_order,
+        """Create an order from watchlist items.
 
     Args:
         watchlist_id: ID of the watchlist to convert
         order_name: Name for the order
         payment_option: "credits" or "paylater"
-    """
-    return await _watchlist_to_order(watchlist_id, order_name, payment_option)
-
-
-@mcp.tool()
-async def get_user_credits() -> str:
-    """Check user's credit balance. Call this before creating orders with credits."""
-    return await _get_user_credits()
-
-
-# ============================================================================
-# CRM Integration Tools
-# ============================================================================
-
-@mcp.tool()
-async def list_crm_orders(
-    page: int = 1,
-    limit: int = 20
-) -> str:
-    """List orders available for CRM integration (Zoho export).
+    """,
+    ),
+    (
+        "get_user_credits",
+        _get_user_credits,
+        """Check user's credit balance. Call this before creating orders with credits.
+    """,
+    ),
+
+    # CRM Integration Tools
+    (
+        "list_crm_orders",
+        _list_crm_orders,
+        """List orders available for CRM integration (Zoho export).
 
     Returns orders that can be exported as Zoho-ready leads.
 
     Args:
         page: Page number (default 1)
         limit: Orders per page (default 20, max 100)
-    """
-    return await _list_crm_orders(page, limit)
-
-
-@mcp.tool()
-async def get_order_leads(order_id: str) -> str:
-    """Get order items as Zoho-ready leads for CRM import.
+    """,
+    ),
+    (
+        "get_order_leads",
+        _get_order_leads,
+        """Get order items as Zoho-ready leads for CRM import.
 
     Returns enriched lead data with:
     - For company/director/gst: 'lead' (Zoho format) and 'full_data'
@@ -469,16 +466,12 @@ async def get_order_leads(order_id: str) -> str:
 
     Args:
         order_id: ID of the order to get leads for
-    """
-    return await _get_order_leads(order_id)
-
-
-@mcp.tool()
-async def get_entity_as_lead(
-    entity_type: str,
-    identifier: str
-) -> str:
-    """Preview an entity as Zoho-ready lead format.
+    """,
+    ),
+    (
+        "get_entity_as_lead",
+        _get_entity_as_lead,
+        """Preview an entity as Zoho-ready lead format.
 
     Use this to see how an entity will appear as a Zoho lead
     before creating an order.
@@ -492,76 +485,60 @@ async def get_entity_as_lead(
     Args:
         entity_type: "company", "director", "gst", or "fullcompany"
         identifier: CIN, DIN, or GSTIN
-    """
-    return await _get_entity_as_lead(entity_type, identifier)
+    """,
+    ),
 
+    # Classification Tools
+    (
+        "lookup_nic_code",
+        _lookup_nic_code,
+        """Lookup NIC (National Industrial Classification) codes.
 
-# ============================================================================
-# Classification Tools
-# ============================================================================
-
-@mcp.tool()
-async def lookup_nic_code(
-    code: Optional[str] = None,
-    search: Optional[str] = None,
-    limit: int = 10
-) -> str:
-    """Lookup NIC (National Industrial Classification) codes.
-    
     Use to understand industry classifications in company data.
-    
+
     Args:
         code: Exact NIC code (e.g., "35101" or "3510" for partial)
         search: Keyword to search (e.g., "software", "manufacturing")
         limit: Maximum results (default 10)
-    """
-    return await _lookup_nic_code(code, search, limit)
-
+    """,
+    ),
+    (
+        "lookup_hsn_code",
+        _lookup_hsn_code,
+        """Lookup HSN (Harmonized System of Nomenclature) codes for goods/products.
 
-@mcp.tool()
-async def lookup_hsn_code(
-    code: Optional[str] = None,
-    search: Optional[str] = None,
-    limit: int = 10
-) -> str:
-    """Lookup HSN (Harmonized System of Nomenclature) codes for goods/products.
-    
     Use to understand product classifications in GST data.
-    
+
     Args:
         code: Exact HSN code (e.g., "01011010" or "0101" for partial)
         search: Keyword to search (e.g., "horses", "textiles")
         limit: Maximum results (default 10)
-    """
-    return await _lookup_hsn_code(code, search, limit)
-
+    """,
+    ),
+    (
+        "lookup_sac_code",
+        _lookup_sac_code,
+        """Lookup SAC (Services Accounting Code) codes for services.
 
-@mcp.tool()
-async def lookup_sac_code(
-    code: Optional[str] = None,
-    search: Optional[str] = None,
-    limit: int = 10
-) -> str:
-    """Lookup SAC (Services Accounting Code) codes for services.
-    
     Use to understand service classifications in GST data.
-    
+
     Args:
         code: Exact SAC code (e.g., "995411" or "9954" for partial)
         search: Keyword to search (e.g., "construction", "consulting")
         limit: Maximum results (default 10)
-    """
-    return await _lookup_sac_code(code, search, limit)
+    """,
+    ),
+]
+
+for _name, _impl, _description in TOOLS:
+    mcp.tool(name=_name, description=_description)(_impl)
 
 
 # ============================================================================
 # MCP Resources (Read-only static information)
 # ============================================================================
 
-@mcp.resource("finscreener://guide/fql")
-def get_fql_guide() -> str:
-    """FQL (FinScreener Query Language) syntax guide."""
-    return """
+FQL_GUIDE = """
 # FQL - FinScreener Query Language Guide
 
 ## Operators
@@ -648,11 +625,7 @@ hsncd IN [5007, 5111] AND BusinessActivities == 'Factory / Manufacturing'
 ```
 """
 
-
-@mcp.resource("finscreener://about")
-def get_about() -> str:
-    """About Finscreener and available data."""
-    return """
+ABOUT = """
 # About Finscreener
 
 Finscreener provides comprehensive access to Indian business data:
@@ -676,6 +649,18 @@ Configure your API key in environment variables:
 """
 
 
+@mcp.resource("finscreener://guide/fql")
+def get_fql_guide() -> str:
+    """FQL (FinScreener Query Language) syntax guide."""
+    return FQL_GUIDE
+
+
+@mcp.resource("finscreener://about")
+def get_about() -> str:
+    """About Finscreener and available data."""
+    return ABOUT
+
+
 # ============================================================================
 # Main Entry Point
 # ============================================================================
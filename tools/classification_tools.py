@@ -3,9 +3,31 @@
 Returns raw JSON for Claude to process.
 """
 
-import json
 from typing import Optional
-from mcp_server.api_client import client
+from mcp_server.api_client import ENDPOINTS, client
+from mcp_server.serde import dumps
+
+
+async def _lookup_code(
+    endpoint: str,
+    code: Optional[str],
+    search: Optional[str],
+    limit: int
+) -> dict:
+    """Fetch reference codes as a parsed dict.
+
+    Classification codes are static, so the client caches these responses;
+    params are normalized so equivalent lookups share a cache entry.
+    """
+    params = {"limit": min(limit, 50)}
+    code = code.strip() if code else None
+    search = search.strip() if search else None
+    if code:
+        params["code"] = code
+    if search:
+        params["search"] = search
+
+    return await client.get(endpoint, params=params)
 
 
 async def lookup_nic_code(
@@ -23,16 +45,10 @@ async def lookup_nic_code(
         limit: Maximum results (default 10, max 50)
     """
     if not code and not search:
-        return json.dumps({"error": "Provide either 'code' or 'search' parameter."})
-
-    params = {"limit": min(limit, 50)}
-    if code:
-        params["code"] = code
-    if search:
-        params["search"] = search
+        return dumps({"error": "Provide either 'code' or 'search' parameter."})
 
-    result = await client.get("/reference/nic", params=params)
-    return json.dumps(result, indent=2, default=str)
+    result = await _lookup_code(ENDPOINTS["reference_nic"], code, search, limit)
+    return dumps(result)
 
 
 async def lookup_hsn_code(
@@ -50,16 +66,10 @@ async def lookup_hsn_code(
         limit: Maximum results (default 10, max 50)
     """
     if not code and not search:
-        return json.dumps({"error": "Provide either 'code' or 'search' parameter."})
-
-    params = {"limit": min(limit, 50)}
-    if code:
-        params["code"] = code
-    if search:
-        params["search"] = search
+        return dumps({"error": "Provide either 'code' or 'search' parameter."})
 
-    result = await client.get("/reference/hsn", params=params)
-    return json.dumps(result, indent=2, default=str)
+    result = await _lookup_code(ENDPOINTS["reference_hsn"], code, search, limit)
+    return dumps(result)
 
 
 async def lookup_sac_code(
@@ -77,13 +87,7 @@ async def lookup_sac_code(
         limit: Maximum results (default 10, max 50)
     """
     if not code and not search:
-        return json.dumps({"error": "Provide either 'code' or 'search' parameter."})
-
-    params = {"limit": min(limit, 50)}
-    if code:
-        params["code"] = code
-    if search:
-        params["search"] = search
+        return dumps({"error": "Provide either 'code' or 'search' parameter."})
 
-    result = await client.get("/reference/sac", params=params)
-    return json.dumps(result, indent=2, default=str)
+    result = await _lookup_code(ENDPOINTS["reference_sac"], code, search, limit)
+    return dumps(result)
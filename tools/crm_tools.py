@@ -9,9 +9,12 @@ Endpoints:
 - POST /api/crm/newlead - Get entity as Zoho lead format (preview)
 """
 
-import json
 from typing import Optional
-from mcp_server.api_client import client
+from mcp_server.api_client import ENDPOINTS, client
+from mcp_server.serde import as_text, dumps
+
+VALID_ENTITY_TYPES = frozenset({"company", "director", "gst", "fullcompany"})
+VALID_ENTITY_TYPES_MSG = sorted(VALID_ENTITY_TYPES)
 
 
 async def list_crm_orders(
@@ -27,8 +30,8 @@ async def list_crm_orders(
         limit: Orders per page (default 20, max 100)
     """
     params = {"page": page, "limit": limit}
-    result = await client.get("/crm/orders", params=params)
-    return json.dumps(result, indent=2, default=str)
+    result = await client.get(ENDPOINTS["crm_orders"], params=params)
+    return dumps(result)
 
 
 async def get_order_leads(order_id: str) -> str:
@@ -43,8 +46,9 @@ async def get_order_leads(order_id: str) -> str:
     Args:
         order_id: ID of the order to get leads for
     """
-    result = await client.get(f"/crm/orders/{order_id}/leads")
-    return json.dumps(result, indent=2, default=str)
+    # Lead exports can run to megabytes; pass the server's JSON through as-is
+    body = await client.get_raw(f"{ENDPOINTS['crm_orders']}/{order_id}/leads")
+    return as_text(body)
 
 
 async def get_entity_as_lead(
@@ -68,17 +72,16 @@ async def get_entity_as_lead(
         entity_type: Type of entity - "company", "director", "gst", or "fullcompany"
         identifier: CIN, DIN, or GSTIN
     """
-    valid_types = ["company", "director", "gst", "fullcompany"]
-    if entity_type not in valid_types:
-        return json.dumps({"error": f"Invalid entity_type '{entity_type}'. Must be one of: {valid_types}"})
+    if entity_type not in VALID_ENTITY_TYPES:
+        return dumps({"error": f"Invalid entity_type '{entity_type}'. Must be one of: {VALID_ENTITY_TYPES_MSG}"})
 
     if not identifier:
-        return json.dumps({"error": "identifier is required (CIN, DIN, or GSTIN)"})
+        return dumps({"error": "identifier is required (CIN, DIN, or GSTIN)"})
 
     payload = {
         "entity_type": entity_type,
         "identifier": identifier
     }
 
-    result = await client.post("/crm/newlead", json_data=payload)
-    return json.dumps(result, indent=2, default=str)
+    result = await client.post(ENDPOINTS["crm_newlead"], json_data=payload)
+    return dumps(result)
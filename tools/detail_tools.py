@@ -4,23 +4,37 @@ Returns raw JSON for Claude to process.
 Rate limited: 100 requests/day for detail endpoints.
 """
 
-import json
-from mcp_server.api_client import client
+from typing import List
+from mcp_server.api_client import ENDPOINTS, client
+from mcp_server.serde import dumps
 
 
 async def get_company_details(cin: str) -> str:
     """Get full company details by CIN. Rate limited: 100/day."""
-    result = await client.get("/company/details", params={"cin": cin})
-    return json.dumps(result, indent=2, default=str)
+    result = await client.get(ENDPOINTS["company_details"], params={"cin": cin})
+    return dumps(result)
 
 
 async def get_director_details(din: str) -> str:
     """Get full director details by DIN. Rate limited: 100/day."""
-    result = await client.get("/company/director-details", params={"din": din})
-    return json.dumps(result, indent=2, default=str)
+    result = await client.get(ENDPOINTS["director_details"], params={"din": din})
+    return dumps(result)
 
 
 async def get_gst_details(gstin: str) -> str:
     """Get full GST registration details by GSTIN. Rate limited: 100/day."""
-    result = await client.get("/gst/details", params={"gstin": gstin})
-    return json.dumps(result, indent=2, default=str)
+    result = await client.get(ENDPOINTS["gst_details"], params={"gstin": gstin})
+    return dumps(result)
+
+
+async def batch_get_company_details(cins: List[str]) -> str:
+    """Get full company details for several CINs concurrently. Rate limited: 100/day.
+
+    Duplicate CINs are fetched once. Returns a mapping of CIN to its details.
+    """
+    unique_cins = list(dict.fromkeys(cin for cin in cins if cin))
+    if not unique_cins:
+        return dumps({"error": "At least one CIN is required."})
+
+    results = await client.batch_get_details("company", unique_cins)
+    return dumps(dict(zip(unique_cins, results)))
@@ -0,0 +1,21 @@
+"""Helpers for reading API rows whose fields come under several aliases."""
+
+from typing import Any, Iterable
+
+
+def first(d: dict, keys: Iterable[str], default: Any = "") -> Any:
+    """Get the first truthy value among `keys` in `d`.
+
+    Stops at the first hit, unlike nested `.get(a, d.get(b, ...))` chains,
+    which evaluate every fallback up front.
+
+    Args:
+        d: Row to read from
+        keys: Field names to try, in order of preference
+        default: Returned when no key has a truthy value
+    """
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return default
@@ -10,9 +10,11 @@ Order Types:
 - fullcompany: Full company data with all directors and GST (5 credits)
 """
 
-import json
-from typing import Optional, List
-from mcp_server.api_client import client
+import asyncio
+from typing import Any, Optional, List
+from mcp_server.api_client import ENDPOINTS, client
+from mcp_server.serde import dumps
+from mcp_server.tools.fields import first
 
 # Credit pricing per order type
 CREDIT_PRICES = {
@@ -22,7 +24,24 @@ CREDIT_PRICES = {
     "fullcompany": 5
 }
 
-VALID_ORDER_TYPES = ["company", "director", "gst", "fullcompany"]
+VALID_ORDER_TYPES = frozenset({"company", "director", "gst", "fullcompany"})
+VALID_ORDER_TYPES_MSG = sorted(VALID_ORDER_TYPES)
+
+PAYMENT_OPTIONS = frozenset({"credits", "cashfree"})
+
+
+def _credit_balance(user: Any) -> Optional[float]:
+    """Get the credit balance from a /users/me response, if it has one."""
+    if not isinstance(user, dict) or user.get("success") == False:
+        return None
+    data = user.get("data", user)
+    if not isinstance(data, dict):
+        return None
+    for key in ("credits", "credit_balance", "creditBalance"):
+        value = data.get(key)
+        if isinstance(value, (int, float)):
+            return float(value)
+    return None
 
 
 async def list_orders(
@@ -38,14 +57,14 @@ async def list_orders(
     if search:
         params["search"] = search
 
-    result = await client.get("/orders", params=params)
-    return json.dumps(result, indent=2, default=str)
+    result = await client.get(ENDPOINTS["orders"], params=params)
+    return dumps(result)
 
 
 async def get_order_details(order_id: str) -> str:
     """Get detailed information about a specific order including contact data."""
-    result = await client.get(f"/orders/{order_id}")
-    return json.dumps(result, indent=2, default=str)
+    result = await client.get(f"{ENDPOINTS['orders']}/{order_id}")
+    return dumps(result)
 
 
 async def create_order(
@@ -62,19 +81,26 @@ async def create_order(
                Types: company (1 credit), director (1 credit), gst (1 credit), fullcompany (5 credits)
                For fullcompany: Returns company + all directors + GST data
     """
-    if payment_option not in ["credits", "cashfree"]:
-        return json.dumps({"error": f"Invalid payment_option '{payment_option}'. Must be 'credits' or 'cashfree'."})
+    if payment_option not in PAYMENT_OPTIONS:
+        return dumps({"error": f"Invalid payment_option '{payment_option}'. Must be 'credits' or 'cashfree'."})
 
     if not items or len(items) == 0:
-        return json.dumps({"error": "At least one item is required to create an order."})
+        return dumps({"error": "At least one item is required to create an order."})
 
     validated_items = []
+    seen = set()
     for i, item in enumerate(items):
         item_type = item.get("type")
         if not item_type or item_type not in VALID_ORDER_TYPES:
-            return json.dumps({"error": f"Item {i+1} has invalid type '{item_type}'. Must be one of: {VALID_ORDER_TYPES}"})
+            return dumps({"error": f"Item {i+1} has invalid type '{item_type}'. Must be one of: {VALID_ORDER_TYPES_MSG}"})
         if not item.get("number"):
-            return json.dumps({"error": f"Item {i+1} is missing 'number' (CIN/DIN/GSTIN)."})
+            return dumps({"error": f"Item {i+1} is missing 'number' (CIN/DIN/GSTIN)."})
+
+        # Skip repeats so the same entity isn't billed twice
+        key = (item_type, item["number"])
+        if key in seen:
+            continue
+        seen.add(key)
 
         # Use correct credit price for the type
         price = CREDIT_PRICES.get(item_type, 1)
@@ -92,8 +118,8 @@ async def create_order(
         "items": validated_items
     }
 
-    result = await client.post("/orders/normal", json_data=payload)
-    return json.dumps(result, indent=2, default=str)
+    result = await client.post(ENDPOINTS["orders_normal"], json_data=payload)
+    return dumps(result)
 
 
 async def watchlist_to_order(
@@ -102,34 +128,55 @@ async def watchlist_to_order(
     payment_option: str
 ) -> str:
     """Create an order from all entities in a watchlist."""
-    if payment_option not in ["credits", "cashfree"]:
-        return json.dumps({"error": f"Invalid payment_option '{payment_option}'. Must be 'credits' or 'cashfree'."})
+    if payment_option not in PAYMENT_OPTIONS:
+        return dumps({"error": f"Invalid payment_option '{payment_option}'. Must be 'credits' or 'cashfree'."})
 
-    # Get watchlist using Developer API
-    wl_result = await client.get(f"/watchlist/{watchlist_id}")
+    # Get watchlist and (when paying with credits) the balance concurrently
+    wl_result, user = await asyncio.gather(
+        client.get(f"{ENDPOINTS['watchlists']}/{watchlist_id}"),
+        client.get(ENDPOINTS["users_me"]) if payment_option == "credits" else asyncio.sleep(0, result=None)
+    )
 
     if isinstance(wl_result, dict) and wl_result.get("success") == False:
-        return json.dumps(wl_result)
+        return dumps(wl_result)
 
     wl_data = wl_result.get("data", wl_result) if isinstance(wl_result, dict) else wl_result
-    items_data = wl_data.get("items", wl_data.get("entities", [])) if isinstance(wl_data, dict) else []
+    items_data = first(wl_data, ("items", "entities"), []) if isinstance(wl_data, dict) else []
 
     if not items_data:
-        return json.dumps({"error": "Watchlist is empty."})
+        return dumps({"error": "Watchlist is empty."})
 
     order_items = []
+    seen = set()
     for item in items_data:
+        item_type = item.get("type", "company")
+        number = first(item, ("number", "identifier"))
+        key = (item_type, number)
+        if key in seen:
+            continue
+        seen.add(key)
         order_items.append({
-            "type": item.get("type", "company"),
-            "name": item.get("name", item.get("number", "Unknown")),
-            "number": item.get("number", item.get("identifier", "")),
-            "price": 10.0
+            "type": item_type,
+            "name": first(item, ("name", "number"), "Unknown"),
+            "number": number,
+            "price": float(CREDIT_PRICES.get(item_type, 1))
         })
 
+    # Fail fast rather than creating an order the balance can't cover
+    balance = _credit_balance(user)
+    if balance is not None:
+        required = sum(CREDIT_PRICES.get(item["type"], 1) for item in order_items)
+        if required > balance:
+            return dumps({
+                "error": f"Insufficient credits: order needs {required}, balance is {balance:g}.",
+                "credits_required": required,
+                "credits_available": balance
+            })
+
     return await create_order(order_name, payment_option, order_items)
 
 
 async def get_user_credits() -> str:
     """Get the current user's credit balance."""
-    result = await client.get("/users/me")
-    return json.dumps(result, indent=2, default=str)
+    result = await client.get(ENDPOINTS["users_me"])
+    return dumps(result)
@@ -7,9 +7,35 @@ COMPANY FIELDS: City, State, paidUpCapital, NICCode, mainDivision, llpStatus, Li
 GST FIELDS: state (lowercase!), Status, saccd, hsncd, ConstitutionBusiness, BusinessActivities
 """
 
-import json
 from typing import Optional, List
-from mcp_server.api_client import client
+from mcp_server.api_client import ENDPOINTS, SERVER_SIDE_CONVERSION, client
+from mcp_server.serde import dumps
+from mcp_server.tools.fields import first
+from mcp_server.tools.order_tools import CREDIT_PRICES
+
+SCREENER_TYPES = frozenset({"company", "gst"})
+ENTITY_TYPES = frozenset({"company", "director", "gst"})
+# Entity types whose identifiers come from company screener results
+COMPANY_ENTITY_TYPES = frozenset({"company", "director"})
+SCREENER_PAYMENT_OPTIONS = frozenset({"credits", "cashfree", "paylater"})
+# Statuses meaning the API doesn't understand "from_query"; retry client-side
+FROM_QUERY_UNSUPPORTED = frozenset({400, 404, 405, 422})
+
+# Entity type -> (identifier, name) extractor for a screener result row
+EXTRACTORS = {
+    "company": lambda i: (
+        first(i, ("CIN", "cin")),
+        first(i, ("company", "companyName"), "Unknown"),
+    ),
+    "director": lambda i: (
+        first(i, ("DIN", "din")),
+        first(i, ("directorName", "name"), "Unknown"),
+    ),
+    "gst": lambda i: (
+        first(i, ("GSTIN", "gstin")),
+        first(i, ("TradeName", "tradeName", "LegalName"), "Unknown"),
+    ),
+}
 
 
 async def run_screener(
@@ -25,15 +51,15 @@ async def run_screener(
     - NICCode IN [62011, 62012] AND State == 'Maharashtra'
     - state == 'Gujarat' AND Status == 'Active' (GST)
     """
-    if type not in ["company", "gst"]:
-        return json.dumps({"error": f"Invalid type '{type}'. Must be 'company' or 'gst'."})
+    if type not in SCREENER_TYPES:
+        return dumps({"error": f"Invalid type '{type}'. Must be 'company' or 'gst'."})
 
     result = await client.post(
-        "/screener/search",
+        ENDPOINTS["screener_search"],
         json_data={"query": query, "type": type, "page": page, "limit": min(limit, 100)},
         timeout=240.0
     )
-    return json.dumps(result, indent=2, default=str)
+    return dumps(result)
 
 
 async def create_screener(
@@ -43,27 +69,47 @@ async def create_screener(
     description: Optional[str] = None
 ) -> str:
     """Save FQL query as reusable screener."""
-    if type not in ["company", "gst"]:
-        return json.dumps({"error": f"Invalid type '{type}'. Must be 'company' or 'gst'."})
+    if type not in SCREENER_TYPES:
+        return dumps({"error": f"Invalid type '{type}'. Must be 'company' or 'gst'."})
 
     payload = {"name": name, "query": query, "type": type}
     if description:
         payload["description"] = description
 
-    result = await client.post("/screener/screeners", json_data=payload)
-    return json.dumps(result, indent=2, default=str)
+    result = await client.post(ENDPOINTS["screeners"], json_data=payload)
+    return dumps(result)
 
 
 async def list_screeners() -> str:
     """List all saved screeners."""
-    result = await client.get("/screener/screeners")
-    return json.dumps(result, indent=2, default=str)
+    result = await client.get(ENDPOINTS["screeners"])
+    return dumps(result)
 
 
 async def get_screener(screener_id: str) -> str:
     """Get saved screener by ID."""
-    result = await client.get(f"/screener/screeners/{screener_id}")
-    return json.dumps(result, indent=2, default=str)
+    result = await client.get(f"{ENDPOINTS['screeners']}/{screener_id}")
+    return dumps(result)
+
+
+async def _replace_screener(screener_id: str, changes: dict) -> dict:
+    """Apply changes with a full GET + PUT, for servers without PATCH."""
+    existing = await client.get(f"{ENDPOINTS['screeners']}/{screener_id}")
+    if isinstance(existing, dict) and existing.get("success") == False:
+        return existing
+
+    data = existing.get("data", existing) if isinstance(existing, dict) else existing
+
+    payload = {
+        "name": data.get("name"),
+        "query": data.get("query"),
+        "type": data.get("type"),
+    }
+    if data.get("description"):
+        payload["description"] = data.get("description")
+    payload.update(changes)
+
+    return await client.put(f"{ENDPOINTS['screeners']}/{screener_id}", json_data=payload)
 
 
 async def update_screener(
@@ -74,28 +120,24 @@ async def update_screener(
     description: Optional[str] = None
 ) -> str:
     """Update an existing screener."""
-    existing = await client.get(f"/screener/screeners/{screener_id}")
-    if isinstance(existing, dict) and existing.get("success") == False:
-        return json.dumps(existing)
-
-    data = existing.get("data", existing) if isinstance(existing, dict) else existing
-
-    payload = {
-        "name": name or data.get("name"),
-        "query": query or data.get("query"),
-        "type": type or data.get("type"),
+    changes = {
+        k: v for k, v in (("name", name), ("query", query), ("type", type), ("description", description))
+        if v
     }
-    if description or data.get("description"):
-        payload["description"] = description or data.get("description")
+    if not changes:
+        return dumps({"error": "Nothing to update. Provide name, query, type, or description."})
 
-    result = await client.put(f"/screener/screeners/{screener_id}", json_data=payload)
-    return json.dumps(result, indent=2, default=str)
+    # Send only the changed fields; one round-trip and no clobbering concurrent edits
+    result = await client.patch(f"{ENDPOINTS['screeners']}/{screener_id}", json_data=changes)
+    if isinstance(result, dict) and result.get("status_code") == 405:
+        result = await _replace_screener(screener_id, changes)
+    return dumps(result)
 
 
 async def delete_screener(screener_id: str) -> str:
     """Delete a saved screener."""
-    result = await client.delete(f"/screener/screeners/{screener_id}")
-    return json.dumps(result, indent=2, default=str)
+    result = await client.delete(f"{ENDPOINTS['screeners']}/{screener_id}")
+    return dumps(result)
 
 
 async def screener_to_watchlist(
@@ -105,46 +147,47 @@ async def screener_to_watchlist(
     limit: int = 100
 ) -> str:
     """Convert screener results to watchlist."""
-    if watchlist_type not in ["company", "director", "gst"]:
-        return json.dumps({"error": f"Invalid type '{watchlist_type}'."})
+    if watchlist_type not in ENTITY_TYPES:
+        return dumps({"error": f"Invalid type '{watchlist_type}'."})
+
+    screener_type = "company" if watchlist_type in COMPANY_ENTITY_TYPES else "gst"
+
+    if SERVER_SIDE_CONVERSION:
+        wl_result = await client.post(
+            ENDPOINTS["watchlists"],
+            json_data={
+                "name": watchlist_name,
+                "watchlist_type": watchlist_type,
+                "from_query": {"query": query, "type": screener_type, "limit": min(limit, 500)}
+            },
+            timeout=240.0
+        )
+        if not (isinstance(wl_result, dict) and wl_result.get("status_code") in FROM_QUERY_UNSUPPORTED):
+            return dumps(wl_result)
 
-    screener_type = "company" if watchlist_type in ["company", "director"] else "gst"
     result = await client.post(
-        "/screener/search",
+        ENDPOINTS["screener_search"],
         json_data={"query": query, "type": screener_type, "page": 1, "limit": min(limit, 500)},
         timeout=240.0
     )
 
     if isinstance(result, dict) and result.get("success") == False:
-        return json.dumps(result)
+        return dumps(result)
 
-    data = result.get("results", result.get("data", result)) if isinstance(result, dict) else result
+    data = first(result, ("results", "data"), result) if isinstance(result, dict) else result
 
     if not isinstance(data, list) or not data:
-        return json.dumps({"error": f"No results found for query: {query}"})
+        return dumps({"error": f"No results found for query: {query}"})
 
+    extract = EXTRACTORS[watchlist_type]
     entities = []
     for item in data[:limit]:
-        if watchlist_type == "company":
-            entities.append({
-                "identifier": item.get("CIN", item.get("cin", "")),
-                "name": item.get("company", item.get("companyName", "Unknown"))
-            })
-        elif watchlist_type == "director":
-            entities.append({
-                "identifier": item.get("DIN", item.get("din", "")),
-                "name": item.get("directorName", item.get("name", "Unknown"))
-            })
-        else:
-            entities.append({
-                "identifier": item.get("GSTIN", item.get("gstin", "")),
-                "name": item.get("TradeName", item.get("tradeName", item.get("LegalName", "Unknown")))
-            })
-
-    entities = [e for e in entities if e.get("identifier")]
+        identifier, name = extract(item)
+        if identifier:
+            entities.append({"identifier": identifier, "name": name})
 
     if not entities:
-        return json.dumps({"error": "No valid entities found."})
+        return dumps({"error": "No valid entities found."})
 
     payload = {
         "name": watchlist_name,
@@ -152,8 +195,8 @@ async def screener_to_watchlist(
         "entities": entities
     }
 
-    wl_result = await client.post("/watchlist", json_data=payload)
-    return json.dumps(wl_result, indent=2, default=str)
+    wl_result = await client.post(ENDPOINTS["watchlists"], json_data=payload)
+    return dumps(wl_result)
 
 
 async def screener_to_order(
@@ -165,67 +208,68 @@ async def screener_to_order(
     limit: Optional[int] = None
 ) -> str:
     """Create order from screener results."""
-    if payment_option not in ["credits", "cashfree", "paylater"]:
-        return json.dumps({"error": f"Invalid payment_option '{payment_option}'."})
+    if payment_option not in SCREENER_PAYMENT_OPTIONS:
+        return dumps({"error": f"Invalid payment_option '{payment_option}'."})
 
     if payment_option == "paylater":
         payment_option = "cashfree"
 
     if screener_id and not query:
-        scr_result = await client.get(f"/screener/screeners/{screener_id}")
+        scr_result = await client.get(f"{ENDPOINTS['screeners']}/{screener_id}")
         if isinstance(scr_result, dict) and scr_result.get("success") == False:
-            return json.dumps(scr_result)
+            return dumps(scr_result)
         scr_data = scr_result.get("data", scr_result) if isinstance(scr_result, dict) else scr_result
         query = scr_data.get("query") if isinstance(scr_data, dict) else None
         type = scr_data.get("type") if isinstance(scr_data, dict) else type
 
     if not query:
-        return json.dumps({"error": "Either query or screener_id required."})
+        return dumps({"error": "Either query or screener_id required."})
 
-    if not type or type not in ["company", "director", "gst"]:
-        return json.dumps({"error": f"Invalid type '{type}'."})
+    if not type or type not in ENTITY_TYPES:
+        return dumps({"error": f"Invalid type '{type}'."})
 
     search_limit = limit or 100
+
+    if SERVER_SIDE_CONVERSION:
+        order_result = await client.post(
+            ENDPOINTS["orders_normal"],
+            json_data={
+                "orderName": order_name,
+                "paymentOption": payment_option,
+                "from_query": {"query": query, "type": type, "limit": search_limit}
+            },
+            timeout=240.0
+        )
+        if not (isinstance(order_result, dict) and order_result.get("status_code") in FROM_QUERY_UNSUPPORTED):
+            return dumps(order_result)
+
     result = await client.post(
-        "/screener/search",
+        ENDPOINTS["screener_search"],
         json_data={"query": query, "type": type, "page": 1, "limit": search_limit},
         timeout=240.0
     )
 
     if isinstance(result, dict) and result.get("success") == False:
-        return json.dumps(result)
+        return dumps(result)
 
-    data = result.get("results", result.get("data", result)) if isinstance(result, dict) else result
+    data = first(result, ("results", "data"), result) if isinstance(result, dict) else result
 
     if not isinstance(data, list) or not data:
-        return json.dumps({"error": f"No results for query: {query}"})
+        return dumps({"error": f"No results for query: {query}"})
 
+    extract = EXTRACTORS[type]
     order_items = []
     for item in data[:search_limit]:
-        if type == "company":
-            order_items.append({
-                "type": "company",
-                "name": item.get("company", item.get("companyName", "Unknown")),
-                "number": item.get("CIN", item.get("cin", "")),
-                "price": 10.0
-            })
-        elif type == "director":
-            order_items.append({
-                "type": "director",
-                "name": item.get("directorName", item.get("name", "Unknown")),
-                "number": item.get("DIN", item.get("din", "")),
-                "price": 10.0
-            })
-        else:
-            order_items.append({
-                "type": "gst",
-                "name": item.get("TradeName", item.get("tradeName", item.get("LegalName", "Unknown"))),
-                "number": item.get("GSTIN", item.get("gstin", "")),
-                "price": 10.0
-            })
+        number, name = extract(item)
+        order_items.append({
+            "type": type,
+            "name": name,
+            "number": number,
+            "price": float(CREDIT_PRICES[type])
+        })
 
     if not order_items:
-        return json.dumps({"error": "No valid items for order."})
+        return dumps({"error": "No valid items for order."})
 
     payload = {
         "orderName": order_name,
@@ -233,5 +277,5 @@ async def screener_to_order(
         "items": order_items
     }
 
-    order_result = await client.post("/orders/normal", json_data=payload)
-    return json.dumps(order_result, indent=2, default=str)
+    order_result = await client.post(ENDPOINTS["orders_normal"], json_data=payload)
+    return dumps(order_result)
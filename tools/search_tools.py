@@ -3,9 +3,56 @@
 Returns raw JSON for Claude to process.
 """
 
-import json
-from typing import Optional
-from mcp_server.api_client import client
+import asyncio
+import re
+from typing import List, Optional, Tuple
+from mcp_server.api_client import ENDPOINTS, MAX_CONCURRENT, client
+from mcp_server.serde import as_text, dumps_compact
+
+# Identifier formats; a query matching one is looked up by that field directly
+CIN_RE = re.compile(r"[A-Za-z][A-Za-z0-9]{20}")
+DIN_RE = re.compile(r"\d{8}", re.ASCII)
+GSTIN_RE = re.compile(r"\d{2}[A-Za-z0-9]{13}", re.ASCII)
+
+# Every identifier has a fixed length; checking it first keeps name queries
+# (the common case) away from the regex engine entirely
+ID_LENGTHS = {"CIN": 21, "DIN": 8, "GSTIN": 15}
+
+NO_QUERIES_ERROR = dumps_compact({"error": "At least one query is required."})
+
+# Bound once; the client is a process-wide singleton
+_get = client.get
+_get_raw = client.get_raw
+
+
+def _classify(query: Optional[str], pattern: re.Pattern, id_field: str, name_field: Optional[str]) -> Tuple[Optional[str], str]:
+    """Pick the search field for a query.
+
+    Returns:
+        (id_field, query) when the stripped query matches `pattern`,
+        otherwise (name_field, query)
+    """
+    q = query.strip() if query else ""
+    if len(q) == ID_LENGTHS[id_field] and pattern.fullmatch(q):
+        return id_field, q
+    return name_field, q
+
+
+def _company_params(
+    query: str,
+    state: Optional[str],
+    city: Optional[str],
+    limit: int
+) -> dict:
+    """Build company-filter query parameters, searching by CIN when query looks like one."""
+    field, q = _classify(query, CIN_RE, "CIN", "company")
+    params = {"page": 1, "limit": min(limit, 100), field: q}
+
+    if state:
+        params["state"] = state
+    if city:
+        params["city"] = city
+    return params
 
 
 async def search_company(
@@ -20,20 +67,35 @@ async def search_company(
     1. lookup_nic_code(search="software") to get NIC codes
     2. run_screener(query="NICCode IN [62011, 62012] AND City == 'Mumbai'", type="company")
     """
-    params = {"page": 1, "limit": min(limit, 100)}
+    body = await _get_raw(ENDPOINTS["company_search"], params=_company_params(query, state, city, limit))
+    return as_text(body)
 
-    if query and len(query) == 21 and query[0].isalpha():
-        params["CIN"] = query
-    else:
-        params["company"] = query
 
-    if state:
-        params["state"] = state
-    if city:
-        params["city"] = city
+async def search_companies_bulk(
+    queries: List[str],
+    state: Optional[str] = None,
+    city: Optional[str] = None,
+    limit: int = 10
+) -> str:
+    """Run several company searches concurrently.
+
+    Duplicate queries are searched once. Returns a mapping of query to its results.
+    """
+    unique_queries = list(dict.fromkeys(q for q in queries if q))
+    if not unique_queries:
+        return NO_QUERIES_ERROR
+
+    sem = asyncio.Semaphore(MAX_CONCURRENT)
 
-    result = await client.get("/company/company-filter", params=params)
-    return json.dumps(result, indent=2, default=str)
+    async def search(q: str) -> dict:
+        async with sem:
+            return await _get(ENDPOINTS["company_search"], params=_company_params(q, state, city, limit))
+
+    results = await asyncio.gather(*(search(q) for q in unique_queries), return_exceptions=True)
+    return dumps_compact({
+        q: {"success": False, "error": f"Unexpected error: {r}"} if isinstance(r, BaseException) else r
+        for q, r in zip(unique_queries, results)
+    })
 
 
 async def search_director(
@@ -44,21 +106,22 @@ async def search_director(
     """Search for directors by name or DIN."""
     params = {"page": 1, "limit": min(limit, 100)}
 
-    if query and query.isdigit() and len(query) == 8:
-        params["DIN"] = query
-    else:
-        name_parts = query.strip().split() if query else []
-        if len(name_parts) >= 2:
-            params["firstName"] = name_parts[0]
-            params["lastName"] = name_parts[-1]
-        elif name_parts:
-            params["firstName"] = name_parts[0]
+    field, q = _classify(query, DIN_RE, "DIN", None)
+    if field:
+        params[field] = q
+    elif q:
+        # Only the first and last names are sent, so don't split the middle;
+        # maxsplit keeps split()'s any-whitespace handling
+        name_parts = q.split(maxsplit=1)
+        params["firstName"] = name_parts[0]
+        if len(name_parts) == 2:
+            params["lastName"] = name_parts[1].rsplit(maxsplit=1)[-1]
 
     if state:
         params["state"] = state
 
-    result = await client.get("/company/director-filter", params=params)
-    return json.dumps(result, indent=2, default=str)
+    body = await _get_raw(ENDPOINTS["director_search"], params=params)
+    return as_text(body)
 
 
 async def search_gst(
@@ -68,17 +131,13 @@ async def search_gst(
     limit: int = 10
 ) -> str:
     """Search for GST registrations by trade name or GSTIN."""
-    params = {"page": 1, "limit": min(limit, 100)}
-
-    if query and len(query) == 15 and query[:2].isdigit():
-        params["GSTIN"] = query
-    else:
-        params["TradeName"] = query
+    field, q = _classify(query, GSTIN_RE, "GSTIN", "TradeName")
+    params = {"page": 1, "limit": min(limit, 100), field: q}
 
     if state:
         params["State"] = state
     if status:
         params["Status"] = status
 
-    result = await client.get("/gst/gst-filter", params=params)
-    return json.dumps(result, indent=2, default=str)
+    body = await _get_raw(ENDPOINTS["gst_search"], params=params)
+    return as_text(body)
@@ -3,15 +3,101 @@
 Returns raw JSON for Claude to process.
 """
 
-import json
-from typing import List, Optional
-from mcp_server.api_client import client
+import asyncio
+from typing import List, Optional, Union
+from mcp_server.api_client import ENDPOINTS, MAX_CONCURRENT, client
+from mcp_server.serde import as_text, dumps_compact
+from mcp_server.tools.fields import first
+
+WATCHLIST_TYPES = frozenset({"company", "director", "gst"})
+
+# Largest page the entities endpoint serves; bigger requests are split
+WATCHLIST_PAGE_CAP = 100
+
+# Most pages get_watchlist_all reads one by one when the API reports no total
+MAX_UNTOTALLED_PAGES = 500
+
+# Keys under which an entities page may carry its list
+ENTITY_LIST_KEYS = ("entities", "items", "data", "results")
+
+# Paging fields that describe a single API page
+PAGE_META_KEYS = frozenset({
+    "page", "limit", "count", "per_page", "page_size", "total_pages", "pages",
+    "has_next", "has_more", "next", "previous", "pagination",
+})
+
+NO_SPECS_ERROR = dumps_compact({"error": "At least one watchlist spec is required."})
+
+# Bound once; the client is a process-wide singleton
+_get = client.get
+_get_raw = client.get_raw
+_post = client.post
+_delete = client.delete
 
 
 async def list_watchlists() -> str:
     """List all watchlists owned by the current user."""
-    result = await client.get("/watchlist")
-    return json.dumps(result, indent=2, default=str)
+    body = await _get_raw(ENDPOINTS["watchlists"])
+    return as_text(body)
+
+
+def _is_error(result) -> bool:
+    return isinstance(result, dict) and result.get("success") == False
+
+
+def _entities_key(result) -> Optional[str]:
+    """Find the key holding a page's entity list."""
+    if isinstance(result, dict):
+        for key in ENTITY_LIST_KEYS:
+            if isinstance(result.get(key), list):
+                return key
+    return None
+
+
+def _page_total(result) -> Optional[int]:
+    """Read the total entity count a page reports, if any."""
+    if not isinstance(result, dict):
+        return None
+    # Only keys that unambiguously mean the whole watchlist; a page-level
+    # "count" would truncate get_watchlist_all to one page
+    pagination = result.get("pagination")
+    for value in (
+        result.get("total"),
+        result.get("total_count"),
+        pagination.get("total") if isinstance(pagination, dict) else None,
+    ):
+        if isinstance(value, int):
+            return value
+    return None
+
+
+async def _get_page(
+    watchlist_id: str,
+    page: int,
+    limit: int,
+    search_query: Optional[str],
+    raw: bool = False
+) -> Union[dict, bytes]:
+    params = {"page": page, "limit": limit}
+    if search_query:
+        params["search_query"] = search_query
+    url = f"{ENDPOINTS['watchlists']}/{watchlist_id}/entities"
+    if raw:
+        return await _get_raw(url, params=params)
+    # Bulk page reads bypass the response cache so they can't evict
+    # long-lived detail and reference entries
+    return await _get(url, params=params, cache=False)
+
+
+async def _get_pages(watchlist_id: str, pages: range, limit: int, search_query: Optional[str]) -> List[dict]:
+    """Fetch several entity pages concurrently, in page order."""
+    sem = asyncio.Semaphore(MAX_CONCURRENT)
+
+    async def fetch(page: int) -> dict:
+        async with sem:
+            return await _get_page(watchlist_id, page, limit, search_query)
+
+    return await asyncio.gather(*(fetch(p) for p in pages))
 
 
 async def get_watchlist_details(
@@ -21,12 +107,86 @@ async def get_watchlist_details(
     search_query: Optional[str] = None
 ) -> str:
     """Get the contents of a specific watchlist."""
-    params = {"page": page, "limit": limit}
-    if search_query:
-        params["search_query"] = search_query
+    if limit <= WATCHLIST_PAGE_CAP:
+        body = await _get_page(watchlist_id, page, limit, search_query, raw=True)
+        return as_text(body)
+
+    # Larger pages than the API serves: fetch the capped pages covering the window
+    start = (page - 1) * limit
+    first_page = start // WATCHLIST_PAGE_CAP + 1
+    last_page = (start + limit - 1) // WATCHLIST_PAGE_CAP + 1
+    results = await _get_pages(watchlist_id, range(first_page, last_page + 1), WATCHLIST_PAGE_CAP, search_query)
+
+    for result in results:
+        if _is_error(result):
+            return dumps_compact(result)
+    key = _entities_key(results[0])
+    if key is None:
+        return dumps_compact(results[0])
 
-    result = await client.get(f"/watchlist/{watchlist_id}/entities", params=params)
-    return json.dumps(result, indent=2, default=str)
+    entities = [e for result in results for e in result.get(key) or []]
+    offset = start - (first_page - 1) * WATCHLIST_PAGE_CAP
+    # The capped pages' paging fields don't describe this window; replace them
+    merged = {k: v for k, v in results[0].items() if k not in PAGE_META_KEYS}
+    merged[key] = entities[offset:offset + limit]
+    merged["pagination"] = {"page": page, "limit": limit}
+    total = _page_total(results[0])
+    if total is not None:
+        merged["pagination"]["total"] = total
+    return dumps_compact(merged)
+
+
+async def get_watchlist_all(watchlist_id: str, search_query: Optional[str] = None) -> str:
+    """Get every entity in a watchlist.
+
+    The first page reveals the total, then the remaining pages are fetched
+    concurrently. Without a reported total, pages are read until an empty one.
+    """
+    first_page = await _get_page(watchlist_id, 1, WATCHLIST_PAGE_CAP, search_query)
+    if _is_error(first_page):
+        return dumps_compact(first_page)
+    key = _entities_key(first_page)
+    if key is None:
+        return dumps_compact(first_page)
+
+    # Copied so extending it can't alter a page shared with a coalesced caller
+    entities = list(first_page[key])
+    total = _page_total(first_page)
+    if total is not None:
+        last_page = -(-total // WATCHLIST_PAGE_CAP)
+        rest = await _get_pages(watchlist_id, range(2, last_page + 1), WATCHLIST_PAGE_CAP, search_query)
+    else:
+        # The server may serve smaller pages than asked for, so only an empty
+        # page marks the end; the page bound guards against ignored paging
+        rest = []
+        page, count = 1, len(entities)
+        while count and page < MAX_UNTOTALLED_PAGES:
+            page += 1
+            result = await _get_page(watchlist_id, page, WATCHLIST_PAGE_CAP, search_query)
+            rest.append(result)
+            count = 0 if _is_error(result) else len(result.get(key) or [])
+
+    for result in rest:
+        if _is_error(result):
+            return dumps_compact(result)
+        entities.extend(result.get(key) or [])
+
+    return dumps_compact({"watchlist_id": watchlist_id, "total": len(entities), key: entities})
+
+
+def _build_payload(name: str, watchlist_type: str, items: Optional[List[dict]] = None) -> dict:
+    """Build the POST body for a new watchlist."""
+    payload = {
+        "name": name,
+        "watchlist_type": watchlist_type,
+    }
+
+    if items:
+        payload["entities"] = [
+            {"identifier": first(item, ("number", "identifier"), None), "name": item.get("name")}
+            for item in items
+        ]
+    return payload
 
 
 async def create_watchlist(
@@ -41,25 +201,44 @@ async def create_watchlist(
         watchlist_type: "company", "director", or "gst"
         items: Optional list of entities with "number" and "name"
     """
-    if watchlist_type not in ["company", "director", "gst"]:
-        return json.dumps({"error": f"Invalid watchlist type '{watchlist_type}'. Must be 'company', 'director', or 'gst'."})
+    if watchlist_type not in WATCHLIST_TYPES:
+        return dumps_compact({"error": f"Invalid watchlist type '{watchlist_type}'. Must be 'company', 'director', or 'gst'."})
 
-    payload = {
-        "name": name,
-        "watchlist_type": watchlist_type,
-    }
+    result = await _post(ENDPOINTS["watchlists"], json_data=_build_payload(name, watchlist_type, items))
+    return dumps_compact(result)
 
-    if items:
-        payload["entities"] = [
-            {"identifier": item.get("number", item.get("identifier")), "name": item.get("name")}
-            for item in items
-        ]
 
-    result = await client.post("/watchlist", json_data=payload)
-    return json.dumps(result, indent=2, default=str)
+async def _create_one(sem: asyncio.Semaphore, spec: dict) -> dict:
+    watchlist_type = spec.get("watchlist_type")
+    if watchlist_type not in WATCHLIST_TYPES:
+        return {"error": f"Invalid watchlist type '{watchlist_type}'. Must be 'company', 'director', or 'gst'."}
+    if not spec.get("name"):
+        return {"error": "Watchlist name is required."}
+    payload = _build_payload(spec["name"], watchlist_type, spec.get("items"))
+    async with sem:
+        return await _post(ENDPOINTS["watchlists"], json_data=payload)
+
+
+async def create_watchlists_bulk(specs: List[dict]) -> str:
+    """Create several watchlists concurrently.
+
+    Args:
+        specs: Watchlists to create, each with "name", "watchlist_type", and optional "items"
+
+    Returns one result per spec, in the same order.
+    """
+    if not specs:
+        return NO_SPECS_ERROR
+
+    sem = asyncio.Semaphore(MAX_CONCURRENT)
+    results = await asyncio.gather(*(_create_one(sem, spec) for spec in specs), return_exceptions=True)
+    return dumps_compact([
+        {"success": False, "error": f"Unexpected error: {r}"} if isinstance(r, BaseException) else r
+        for r in results
+    ])
 
 
 async def delete_watchlist(watchlist_id: str) -> str:
     """Delete a watchlist."""
-    result = await client.delete(f"/watchlist/{watchlist_id}")
-    return json.dumps(result, indent=2, default=str)
+    result = await _delete(f"{ENDPOINTS['watchlists']}/{watchlist_id}")
+    return dumps_compact(result)